@@ -1,10 +1,11 @@
 from datetime import timedelta
-from typing import Union, List, Any
+from typing import Union, List, Any, Optional
 from urllib.parse import ParseResult
 from RPA.Browser.Selenium import Selenium
 from RPA.Robocorp.WorkItems import WorkItems
 import robocorp.log as logger
 from script.exceptions import ElementInteractionError
+from script.cache import SearchCache
 from script.utils import (
     download_image,
     count_keyword,
@@ -230,14 +231,17 @@ class GothamistAction(BrowserAction):
     Class for performing actions specific to Gothamist website.
     """
 
-    def __init__(self, selenium: Selenium):
+    def __init__(self, selenium: Selenium, cache: SearchCache = None):
         """
         Initializes GothamistAction with a Selenium instance and URL.
         
         Args:
             selenium (Selenium): Instance of Selenium.
+            cache (SearchCache, optional): Cache used to serve repeated searches. Defaults to None.
         """
         super().__init__(selenium)
+        self.cache = cache
+        self.served_from_cache = False
 
     def _search_variable(self, variable: str) -> None:
         """
@@ -420,6 +424,67 @@ class GothamistAction(BrowserAction):
                 "count_phrases_description": count_keyword(description, search_phrase), 'contains_money_description':
                     check_money(description), 'contains_money_title': check_money(title)}
 
+    def _probe_news_number(self, news_phrase: str) -> int:
+        """
+        Retrieve the number of news available for a news phrase.
+        This method opens the browser, searches for the news phrase and reads the result count only,
+        without visiting any of the news articles.
+        If the number of news cannot be located an exception is raised.
+
+        Args:
+            news_phrase: the search phrase used to retrieve the articles.
+
+        Returns:
+            int: Number of news available for the news phrase.
+        """
+        self.connect(url=URL.GOTHAMIST_URL)
+        self.maximize()
+        self._search_variable(news_phrase)
+        return self._retrieve_news_number()
+
+    def _revalidate_count(self, entry: dict, news_phrase: str) -> Optional[int]:
+        """
+        Retrieve the number of news available for a news phrase that has a cache entry.
+        If there is no entry, or the entry is past its maximum age, None is returned without opening the browser.
+        Otherwise the browser is left open on the search results page.
+        If the number of news cannot be located an exception is raised.
+
+        Args:
+            entry: the cache entry already loaded for the news phrase.
+            news_phrase: the search phrase used to retrieve the articles.
+
+        Returns:
+            int: Number of news available for the news phrase, or None if the entry cannot be revalidated.
+        """
+        if entry is None or not self.cache.can_revalidate(entry):
+            return None
+        return self._probe_news_number(news_phrase)
+
+    def has_result_count_changed(self, news_phrase: str) -> bool:
+        """
+        Check if the number of news available for a news phrase differs from the cached one.
+        This method can be used to decide whether a refresh is needed at all. If there is no cache, no
+        entry for the news phrase, or the entry is past its maximum age, it is considered changed without
+        opening the browser. The browser is closed after the probe.
+        Upon failure, it raises an exception.
+
+        Args:
+            news_phrase: the search phrase used to retrieve the articles.
+
+        Returns:
+            bool: True if the result count has changed, False otherwise.
+        """
+        entry = self.cache.get(news_phrase) if self.cache is not None else None
+        try:
+            news_number = self._revalidate_count(entry, news_phrase)
+        except Exception:
+            self.close_browser()
+            raise
+        if news_number is None:
+            return True
+        self.close_browser()
+        return self.cache.has_count_changed(entry, news_number)
+
     def main(self, news_phrase: str) -> list:
         """
         Main function of the script.
@@ -427,6 +492,8 @@ class GothamistAction(BrowserAction):
         it will open the browser, maximize it to ensure items are visible and search for the news. It will navigate to
         all the news articles required and retrieve all the information.
         The method returns a list of dictionaries containing all the information of the news articles.
+        If a cache is set, a fresh entry for the news phrase is returned without opening the browser. An expired
+        entry is returned as well if the number of news has not changed, until it reaches its maximum age.
         If there is no news or some element causes a problem, it reattempts upto 3 times.
         Upon failure, it raises an exception
 
@@ -437,19 +504,35 @@ class GothamistAction(BrowserAction):
         Returns:
             list: List of dictionaries.
         """
+        self.served_from_cache = False
+        entry = self.cache.get(news_phrase) if self.cache is not None else None
+        if entry is not None and self.cache.is_fresh(entry):
+            self.logger.info(f"Serving news for '{news_phrase}' from cache")
+            self.served_from_cache = True
+            return entry["records"]
         try:
-            self.connect(url=URL.GOTHAMIST_URL)
-            self.maximize()
-            self._search_variable(news_phrase)
-            if self._retrieve_news_number() > 0:
+            news_number = self._revalidate_count(entry, news_phrase)
+            if news_number is not None and not self.cache.has_count_changed(entry, news_number):
+                self.logger.info(f"News count for '{news_phrase}' unchanged, serving from cache")
+                self.cache.touch(entry)
+                self.served_from_cache = True
+                self.close_browser()
+                return entry["records"]
+            if news_number is None:
+                news_number = self._probe_news_number(news_phrase)
+            if news_number > 0:
                 description = self._retrieve_description()
                 links = self._retrieve_links()
                 data = []
                 for i in range(len(links)):
                     data.append(self._handle_links(url=links[i], description=description[i], search_phrase=news_phrase))
+                if self.cache is not None:
+                    self.cache.store(news_phrase, news_number, links, data)
                 return data
             else:
                 self.logger.warn("No news available")
+                if self.cache is not None:
+                    self.cache.store(news_phrase, news_number, [], [])
                 self.close_browser()
                 return []
         except ElementInteractionError as e:
@@ -0,0 +1,243 @@
+import os
+import json
+import time
+import hashlib
+import tempfile
+from pathlib import Path
+from typing import Optional
+import robocorp.log as logger
+from script.constants import (
+    Directories,
+    CacheSettings
+)
+
+
+class SearchCache:
+    """
+    Class for storing search results on the local disk so that repeated searches can be served without
+    re-running the whole browser flow.
+
+    The cache directory defaults to './cache/' and can be moved with the NEWS_CACHE_DIRECTORY environment
+    variable. It is kept outside of the artifacts directory so that entries survive between runs.
+    Cached records keep the 'picture_filename' of the run that scraped them. Those images live in the
+    artifacts directory and may be gone when an entry is served from the cache.
+    """
+
+    def __init__(self, directory: str = Directories.CACHE_DIRECTORY, ttl_sec: int = CacheSettings.TTL_SECONDS,
+                 max_age_sec: int = CacheSettings.MAX_AGE_SECONDS):
+        """
+        Initializes SearchCache with a storage directory, a time to live and a maximum age.
+
+        Args:
+            directory (str, optional): Directory where the cache entries are stored.
+            ttl_sec (int, optional): Number of seconds a cache entry is served without any check.
+            max_age_sec (int, optional): Number of seconds after scraping during which an unchanged
+                result count is enough to keep serving a cache entry.
+        """
+        self.directory = directory
+        self.ttl_sec = ttl_sec
+        self.max_age_sec = max_age_sec
+        self.logger = logger
+
+    @staticmethod
+    def normalize_phrase(phrase: str) -> str:
+        """
+        Normalize a search phrase so that phrases differing only in case or whitespace share an entry.
+
+        Args:
+            phrase (str): The search phrase.
+
+        Returns:
+            str: The normalized search phrase.
+        """
+        return " ".join(phrase.lower().split())
+
+    def _path(self, phrase: str) -> str:
+        """
+        Build the file path of the cache entry for a search phrase.
+
+        Args:
+            phrase (str): The search phrase.
+
+        Returns:
+            str: Full path to the cache entry file.
+        """
+        name = hashlib.sha1(self.normalize_phrase(phrase).encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, name + Directories.CACHE_FILE_EXT)
+
+    def get(self, phrase: str) -> Optional[dict]:
+        """
+        Retrieve the cache entry for a search phrase, whether it is fresh or not.
+        If the entry does not exist, cannot be read or is missing any of the expected keys, None is returned.
+        This method does not raise an exception.
+
+        Args:
+            phrase (str): The search phrase.
+
+        Returns:
+            dict: The cache entry, or None if there is none.
+        """
+        file_path = self._path(phrase)
+        if not Path(file_path).is_file():
+            return None
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError) as e:
+            self.logger.warn(f"Error reading cache entry {file_path}: {e}")
+            return None
+        if not isinstance(entry, dict) or any(key not in entry for key in CacheSettings.ENTRY_KEYS):
+            self.logger.warn(f"Invalid cache entry {file_path}")
+            return None
+        return entry
+
+    def is_fresh(self, entry: dict) -> bool:
+        """
+        Check if a cache entry is still within its time to live.
+
+        Args:
+            entry (dict): The cache entry.
+
+        Returns:
+            bool: True if the entry can be served as is, False otherwise.
+        """
+        return time.time() - entry["updated_at"] < self.ttl_sec
+
+    def can_revalidate(self, entry: dict) -> bool:
+        """
+        Check if a cache entry is young enough to be kept on an unchanged result count.
+        Past this age a full refresh is needed, so that the records are scraped again.
+
+        Args:
+            entry (dict): The cache entry.
+
+        Returns:
+            bool: True if the result count probe can be trusted for the entry, False otherwise.
+        """
+        return time.time() - entry["created_at"] < self.max_age_sec
+
+    @staticmethod
+    def has_count_changed(entry: dict, news_number: int) -> bool:
+        """
+        Check if the number of news available for a search differs from the cached one.
+
+        Args:
+            entry (dict): The cache entry.
+            news_number (int): Number of news currently available for the search phrase.
+
+        Returns:
+            bool: True if the result count has changed, False otherwise.
+        """
+        return entry["news_number"] != news_number
+
+    def _write(self, entry: dict) -> dict:
+        """
+        Write a cache entry to the disk.
+        The entry is written to a temporary file first and moved into place, so that an interrupted
+        write never leaves a partial entry. If the entry cannot be written, a warning is logged.
+        This method does not raise an exception.
+
+        Args:
+            entry (dict): The cache entry.
+
+        Returns:
+            dict: The cache entry.
+        """
+        file_path = self._path(entry["phrase"])
+        temp_path = None
+        try:
+            if not os.path.exists(self.directory):
+                os.makedirs(self.directory)
+            with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=self.directory,
+                                             suffix=".tmp", delete=False) as f:
+                temp_path = f.name
+                json.dump(entry, f)
+            os.replace(temp_path, file_path)
+            self.logger.info(f"Cache entry saved: {file_path}")
+        except (OSError, TypeError, ValueError) as e:
+            self.logger.warn(f"Error writing cache entry {file_path}: {e}")
+            if temp_path is not None:
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
+        return entry
+
+    def store(self, phrase: str, news_number: int, links: list, records: list) -> dict:
+        """
+        Store the results of a search as a new cache entry.
+        This method does not raise an exception.
+
+        Args:
+            phrase (str): The search phrase.
+            news_number (int): Number of news available for the search phrase.
+            links (list): Links retrieved from the search page.
+            records (list): List of dictionaries with the data of every news article.
+
+        Returns:
+            dict: The stored cache entry.
+        """
+        now = time.time()
+        entry = {"phrase": self.normalize_phrase(phrase), "created_at": now, "updated_at": now,
+                 "news_number": news_number, "links": links, "records": records, "excel_file": None}
+        return self._write(entry)
+
+    def touch(self, entry: dict) -> dict:
+        """
+        Mark a cache entry as fresh again after the probe found no change.
+        This does not move 'created_at', so the entry still expires once it reaches the maximum age.
+        This method does not raise an exception.
+
+        Args:
+            entry (dict): The cache entry.
+
+        Returns:
+            dict: The updated cache entry.
+        """
+        entry["updated_at"] = time.time()
+        return self._write(entry)
+
+    @staticmethod
+    def excel_name(entry: dict) -> str:
+        """
+        Build the Excel file name for a cache entry.
+        The name includes the time the entry was scraped, so that a refreshed entry gets a new workbook
+        instead of adding its rows to the workbook of an older entry.
+
+        Args:
+            entry (dict): The cache entry.
+
+        Returns:
+            str: Name of the Excel file, without extension.
+        """
+        return f"{entry['phrase']}_{int(entry['created_at'])}"
+
+    def set_excel_file(self, phrase: str, file_path: str) -> None:
+        """
+        Record the Excel file produced from the cached records of a search phrase.
+        This method does not raise an exception.
+
+        Args:
+            phrase (str): The search phrase.
+            file_path (str): Full path to the Excel file.
+        """
+        entry = self.get(phrase)
+        if entry is not None:
+            entry["excel_file"] = file_path
+            self._write(entry)
+
+    def get_excel_file(self, phrase: str) -> Optional[str]:
+        """
+        Retrieve the Excel file produced from the cached records of a search phrase.
+        If no entry exists or the file was removed, None is returned.
+
+        Args:
+            phrase (str): The search phrase.
+
+        Returns:
+            str: Full path to the Excel file, or None if it is not available.
+        """
+        entry = self.get(phrase)
+        if entry is None or entry["excel_file"] is None or not Path(entry["excel_file"]).is_file():
+            return None
+        return entry["excel_file"]
@@ -1,3 +1,6 @@
+import os
+
+
 class Selector:
     TITLE = "xpath://h1[contains(@class,'h2')]"
     DATE = "xpath://p[@class='type-caption']"
@@ -15,8 +18,16 @@ class Directories:
     LOG_DIRECTORY = './output/browser_action.log'
     EXCEL_DIRECTORY = './output/'
     EXCEL_FILE_EXT = ".xlsx"
+    CACHE_DIRECTORY = os.environ.get('NEWS_CACHE_DIRECTORY', './cache/')
+    CACHE_FILE_EXT = ".json"
     SUPPORTED_IMAGE_FORMATS = [".jpg", ".jpeg", ".png"]
 
 
+class CacheSettings:
+    TTL_SECONDS = 3600
+    MAX_AGE_SECONDS = 86400
+    ENTRY_KEYS = ("phrase", "created_at", "updated_at", "news_number", "records", "excel_file")
+
+
 class URL:
     GOTHAMIST_URL = 'https://gothamist.com/search'
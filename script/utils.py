@@ -19,7 +19,7 @@ def export_data_to_excel(name, data):
         data (list): List of dictionaries representing rows of data.
 
     Returns:
-        None
+        str: Full path to the Excel file.
     """
     if not name.endswith(Directories.EXCEL_FILE_EXT):
         name += Directories.EXCEL_FILE_EXT
@@ -36,6 +36,7 @@ def export_data_to_excel(name, data):
         excel.create_worksheet(name=name, content=data, header=True)
         excel.save_workbook(file_path)
     logging.info(f"Data exported to Excel file: {file_path}")
+    return file_path
 
 
 def download_image(image_url, image_name, directory):
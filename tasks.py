@@ -1,5 +1,6 @@
 from robocorp.tasks import task
 from script.browser import GothamistAction
+from script.cache import SearchCache
 from script.utils import export_data_to_excel
 from script.workitem import WorkItemProcessor
 from RPA.Browser.Selenium import Selenium
@@ -8,10 +9,18 @@ from RPA.Browser.Selenium import Selenium
 @task
 def robot_spare_bin_python():
     selenium = Selenium()
-    gotham = GothamistAction(selenium=selenium)
+    cache = SearchCache()
+    gotham = GothamistAction(selenium=selenium, cache=cache)
     item =  WorkItemProcessor().retrieve_work_item('news')
     data = gotham.main(item)
-    export_data_to_excel(item , data)
+    if gotham.served_from_cache and cache.get_excel_file(item) is not None:
+        return
+    entry = cache.get(item)
+    if entry is None:
+        export_data_to_excel(SearchCache.normalize_phrase(item), data)
+        return
+    file_path = export_data_to_excel(SearchCache.excel_name(entry), data)
+    cache.set_excel_file(item, file_path)
 
 
 
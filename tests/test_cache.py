@@ -0,0 +1,167 @@
+import os
+from unittest.mock import MagicMock
+from script.browser import GothamistAction
+from script.cache import SearchCache
+
+
+def test_normalized_phrases_share_an_entry(tmp_path):
+    cache = SearchCache(directory=str(tmp_path))
+    cache.store("  New   York ", 3, ["link"], [{"title": "News"}])
+
+    entry = cache.get("new york")
+
+    assert entry["phrase"] == "new york"
+    assert entry["records"] == [{"title": "News"}]
+
+
+def test_entry_expires_after_ttl(tmp_path):
+    cache = SearchCache(directory=str(tmp_path), ttl_sec=60)
+    entry = cache.store("economy", 1, [], [])
+    assert cache.is_fresh(entry)
+
+    entry["updated_at"] -= 61
+    assert not cache.is_fresh(entry)
+
+
+def test_touch_does_not_extend_max_age(tmp_path):
+    cache = SearchCache(directory=str(tmp_path), ttl_sec=60, max_age_sec=120)
+    entry = cache.store("economy", 1, [], [])
+    entry["created_at"] -= 121
+    entry["updated_at"] -= 121
+
+    entry = cache.touch(entry)
+
+    assert cache.is_fresh(entry)
+    assert not cache.can_revalidate(entry)
+
+
+def test_get_returns_none_on_corrupt_entry(tmp_path):
+    cache = SearchCache(directory=str(tmp_path))
+    cache.store("economy", 1, [], [])
+    with open(cache._path("economy"), 'w', encoding='utf-8') as f:
+        f.write("{not json")
+
+    assert cache.get("economy") is None
+
+
+def test_write_failure_is_not_raised(tmp_path):
+    cache = SearchCache(directory=str(tmp_path))
+
+    entry = cache.store("economy", 1, [], [{"title": object()}])
+
+    assert entry["news_number"] == 1
+    assert cache.get("economy") is None
+    assert os.listdir(tmp_path) == []
+
+
+def test_excel_file_round_trip(tmp_path):
+    cache = SearchCache(directory=str(tmp_path / "cache"))
+    entry = cache.store("economy", 1, ["link"], [{"title": "News"}])
+    excel_file = tmp_path / "economy.xlsx"
+    excel_file.write_bytes(b"")
+
+    cache.touch(entry)
+    cache.set_excel_file("Economy", str(excel_file))
+    assert cache.get_excel_file("economy") == str(excel_file)
+
+    excel_file.unlink()
+    assert cache.get_excel_file("economy") is None
+
+
+def test_main_serves_fresh_entry_without_browser(tmp_path):
+    cache = SearchCache(directory=str(tmp_path))
+    cache.store("economy", 1, ["link"], [{"title": "News"}])
+    gotham = GothamistAction(selenium=MagicMock(), cache=cache)
+    gotham.connect = MagicMock()
+
+    data = gotham.main("Economy")
+
+    assert data == [{"title": "News"}]
+    assert gotham.served_from_cache
+    gotham.connect.assert_not_called()
+
+
+def test_probe_skipped_past_max_age(tmp_path):
+    cache = SearchCache(directory=str(tmp_path), max_age_sec=120)
+    entry = cache.store("economy", 1, [], [])
+    entry["created_at"] -= 121
+    cache.touch(entry)
+    gotham = GothamistAction(selenium=MagicMock(), cache=cache)
+    gotham.connect = MagicMock()
+
+    assert gotham.has_result_count_changed("economy")
+    gotham.connect.assert_not_called()
+
+
+def test_get_returns_none_on_invalid_entry(tmp_path):
+    cache = SearchCache(directory=str(tmp_path))
+    cache.store("economy", 1, [], [])
+    for content in ("{}", "[]"):
+        with open(cache._path("economy"), 'w', encoding='utf-8') as f:
+            f.write(content)
+
+        assert cache.get("economy") is None
+
+
+def test_excel_name_changes_on_refresh(tmp_path):
+    cache = SearchCache(directory=str(tmp_path))
+    entry = cache.store("Economy", 1, [], [])
+    refreshed = dict(entry, created_at=entry["created_at"] + 60)
+
+    assert SearchCache.excel_name(entry).startswith("economy_")
+    assert SearchCache.excel_name(entry) != SearchCache.excel_name(refreshed)
+
+
+def _expired_action(tmp_path, news_number, news_count):
+    cache = SearchCache(directory=str(tmp_path), ttl_sec=60)
+    entry = cache.store("economy", news_number, ["link"], [{"title": "News"}])
+    entry["updated_at"] -= 61
+    cache._write(entry)
+    cache.store = MagicMock(wraps=cache.store)
+    gotham = GothamistAction(selenium=MagicMock(), cache=cache)
+    gotham._probe_news_number = MagicMock(return_value=news_count)
+    gotham.close_browser = MagicMock()
+    return gotham, entry["updated_at"]
+
+
+def test_main_serves_expired_entry_with_unchanged_count(tmp_path):
+    gotham, updated_at = _expired_action(tmp_path, 1, 1)
+    gotham._retrieve_links = MagicMock()
+
+    data = gotham.main("economy")
+
+    assert data == [{"title": "News"}]
+    assert gotham.served_from_cache
+    assert gotham.cache.get("economy")["updated_at"] > updated_at
+    gotham.close_browser.assert_called_once()
+    gotham._retrieve_links.assert_not_called()
+    gotham.cache.store.assert_not_called()
+
+
+def test_main_refreshes_expired_entry_with_changed_count(tmp_path):
+    gotham, _ = _expired_action(tmp_path, 1, 2)
+    gotham._retrieve_description = MagicMock(return_value=["first", "second"])
+    gotham._retrieve_links = MagicMock(return_value=["link-1", "link-2"])
+    gotham._handle_links = MagicMock(side_effect=lambda url, description, search_phrase: {"title": url})
+
+    data = gotham.main("economy")
+
+    assert data == [{"title": "link-1"}, {"title": "link-2"}]
+    assert not gotham.served_from_cache
+    gotham._probe_news_number.assert_called_once_with("economy")
+    gotham.cache.store.assert_called_once_with("economy", 2, ["link-1", "link-2"], data)
+    assert gotham.cache.get("economy")["news_number"] == 2
+
+
+def test_main_caches_zero_results(tmp_path):
+    cache = SearchCache(directory=str(tmp_path))
+    gotham = GothamistAction(selenium=MagicMock(), cache=cache)
+    gotham._probe_news_number = MagicMock(return_value=0)
+    gotham.close_browser = MagicMock()
+
+    assert gotham.main("economy") == []
+
+    entry = cache.get("economy")
+    assert entry["news_number"] == 0
+    assert entry["records"] == []
+    gotham.close_browser.assert_called_once()